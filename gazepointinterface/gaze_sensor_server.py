@@ -3,7 +3,11 @@ A client-server implementation for handling Gazepoint eye tracker data.
 Receives data from a Gazepoint device and forwards it to connected clients.
 """
 
+import argparse
+import errno
+import os
 import socket
+import stat
 import threading
 import logging
 import time
@@ -11,6 +15,13 @@ from typing import List, Optional, Set
 from dataclasses import dataclass
 from contextlib import contextmanager
 
+from gazepointinterface.socket_utils import (
+    configure_socket,
+    create_socket,
+    send_buffers,
+    validate_buffer_size,
+)
+
 
 @dataclass
 class GazepointConfig:
@@ -21,6 +32,8 @@ class GazepointConfig:
     buffer_size: int = 4096
     reconnect_delay: float = 5.0
     initialization_commands: List[str] = None
+    tcp_nodelay: bool = False
+    recv_buffer_size: Optional[int] = None
 
     def __post_init__(self):
         if self.initialization_commands is None:
@@ -29,6 +42,7 @@ class GazepointConfig:
                 '<SET ID="ENABLE_SEND_POG_FIX" STATE="1" />\r\n',
                 '<SET ID="ENABLE_SEND_DATA" STATE="1" />\r\n',
             ]
+        validate_buffer_size("recv_buffer_size", self.recv_buffer_size)
 
 
 @dataclass
@@ -39,6 +53,18 @@ class ServerConfig:
     port: int = 6970
     max_clients: int = 5
     buffer_size: int = 4096
+    # Transport tuning; each option can be toggled independently.
+    tcp_nodelay: bool = False
+    send_buffer_size: Optional[int] = None
+    flush_interval: Optional[float] = None
+    unix_socket_path: Optional[str] = None
+
+    def __post_init__(self):
+        if self.flush_interval is not None and self.flush_interval <= 0:
+            raise ValueError(
+                f"flush_interval must be positive or None. Got {self.flush_interval}"
+            )
+        validate_buffer_size("send_buffer_size", self.send_buffer_size)
 
 
 class GazepointClient:
@@ -86,7 +112,10 @@ class GazepointClient:
             bool: True if connection successful, False otherwise
         """
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._socket = create_socket(
+                tcp_nodelay=self.config.tcp_nodelay,
+                recv_buffer_size=self.config.recv_buffer_size,
+            )
             self._socket.connect((self.config.host, self.config.port))
             self._send_initialization_commands()
             self._connected = True
@@ -157,9 +186,16 @@ class DataForwardingServer:
         """
         self.config = config
         self._server_socket: Optional[socket.socket] = None
+        self._unix_socket: Optional[socket.socket] = None
+        self._unix_socket_bound = False
+        self._unix_socket_inode: Optional[int] = None
         self._clients: Set[socket.socket] = set()
         self._running = False
         self._lock = threading.Lock()
+        self._pending: List[bytes] = []
+        self._pending_lock = threading.Lock()
+        self._flush_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         self._logger = logging.getLogger(__name__)
         self._setup_logging()
 
@@ -187,23 +223,110 @@ class DataForwardingServer:
             )
 
             # Start accepting clients in a separate thread
-            threading.Thread(target=self._accept_clients, daemon=True).start()
+            threading.Thread(
+                target=self._accept_clients, args=(self._server_socket,), daemon=True
+            ).start()
+
+            if self.config.unix_socket_path:
+                self._start_unix_listener()
+
+            if self.config.flush_interval is not None:
+                with self._pending_lock:
+                    self._pending.clear()
+                self._stop_event.clear()
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop, daemon=True, name="GazeFlush"
+                )
+                self._flush_thread.start()
 
         except socket.error as e:
             self._logger.error(f"Failed to start server: {e}")
+            # Don't leave a half-started server behind
+            self.close()
             raise
 
-    def _accept_clients(self) -> None:
-        """Accept new client connections."""
-        while self._running and self._server_socket:
+    def _start_unix_listener(self) -> None:
+        """Start an additional AF_UNIX listener for clients on the same host."""
+        path = self.config.unix_socket_path
+        self._unix_socket = create_socket(unix=True)
+        self._remove_stale_unix_socket(path)
+        self._unix_socket.bind(path)
+        self._unix_socket_bound = True
+        self._unix_socket_inode = os.lstat(path).st_ino
+        self._unix_socket.listen(self.config.max_clients)
+        self._logger.info(f"Server listening on unix socket {path}")
+
+        threading.Thread(
+            target=self._accept_clients, args=(self._unix_socket,), daemon=True
+        ).start()
+
+    @staticmethod
+    def _remove_stale_unix_socket(path: str) -> None:
+        """
+        Remove a socket file left behind by a server that is no longer running.
+
+        Anything at path that is not a socket is left untouched, so bind() fails
+        on it instead of the file being deleted.
+
+        Args:
+            path: Filesystem path of the unix socket
+
+        Raises:
+            socket.error: If another server is still listening on path
+        """
+        try:
+            mode = os.lstat(path).st_mode
+        except FileNotFoundError:
+            return
+        if not stat.S_ISSOCK(mode):
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+        finally:
+            probe.close()
+        raise socket.error(errno.EADDRINUSE, f"Address already in use: {path}")
+
+    def _accept_clients(self, listener: socket.socket) -> None:
+        """
+        Accept new client connections.
+
+        Args:
+            listener: Listening socket to accept connections from
+        """
+        while self._running:
             try:
-                client_socket, address = self._server_socket.accept()
+                client_socket, address = listener.accept()
+                try:
+                    configure_socket(
+                        client_socket,
+                        tcp_nodelay=self.config.tcp_nodelay,
+                        send_buffer_size=self.config.send_buffer_size,
+                    )
+                except (socket.error, TypeError, OverflowError) as e:
+                    self._logger.error(f"Error configuring client socket: {e}")
+                    client_socket.close()
+                    continue
                 with self._lock:
                     self._clients.add(client_socket)
-                self._logger.info(f"New client connected from {address}")
+                self._logger.info(
+                    f"New client connected from {address or self.config.unix_socket_path}"
+                )
             except socket.error as e:
                 if self._running:
                     self._logger.error(f"Error accepting client: {e}")
+                else:
+                    break
+
+    @property
+    def client_count(self) -> int:
+        """Number of currently connected clients."""
+        with self._lock:
+            return len(self._clients)
 
     def forward_data(self, data: str) -> None:
         """
@@ -215,6 +338,13 @@ class DataForwardingServer:
         if not data:
             return
 
+        if self.config.flush_interval is not None:
+            # Coalesced on the next flush tick; dropped while no flush thread runs
+            with self._pending_lock:
+                if self._flush_thread is not None:
+                    self._pending.append(data.encode())
+            return
+
         with self._lock:
             disconnected_clients = set()
             for client in self._clients:
@@ -224,15 +354,55 @@ class DataForwardingServer:
                     self._logger.error(f"Error forwarding data to client: {e}")
                     disconnected_clients.add(client)
 
-            # Remove disconnected clients
-            for client in disconnected_clients:
-                self._clients.remove(client)
-                client.close()
+            self._remove_clients(disconnected_clients)
+
+    def _flush_loop(self) -> None:
+        """Periodically flush batched records. Runs in a separate thread."""
+        while not self._stop_event.wait(self.config.flush_interval):
+            self._flush_pending()
+        self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Send all records queued since the last flush to every client."""
+        with self._pending_lock:
+            if not self._pending:
+                return
+            buffers, self._pending = self._pending, []
+
+        with self._lock:
+            disconnected_clients = set()
+            for client in self._clients:
+                try:
+                    send_buffers(client, buffers)
+                except socket.error as e:
+                    self._logger.error(f"Error forwarding data to client: {e}")
+                    disconnected_clients.add(client)
+
+            self._remove_clients(disconnected_clients)
+
+    def _remove_clients(self, clients: Set[socket.socket]) -> None:
+        """
+        Remove and close disconnected clients. Caller must hold the client lock.
+
+        Args:
+            clients: Client sockets to remove
+        """
+        for client in clients:
+            self._clients.remove(client)
+            client.close()
 
     def close(self) -> None:
         """Clean up resources and close all connections."""
         self._running = False
 
+        # Stop the flush thread, sending whatever is still queued. Clearing the
+        # reference under the lock stops forward_data() from queueing more.
+        with self._pending_lock:
+            flush_thread, self._flush_thread = self._flush_thread, None
+        if flush_thread:
+            self._stop_event.set()
+            flush_thread.join()
+
         # Close all client connections
         with self._lock:
             for client in self._clients:
@@ -245,6 +415,7 @@ class DataForwardingServer:
         # Close server socket
         if self._server_socket:
             try:
+                self._wake_listener(self._server_socket)
                 self._server_socket.close()
                 self._logger.info("Server shut down")
             except socket.error as e:
@@ -252,9 +423,82 @@ class DataForwardingServer:
             finally:
                 self._server_socket = None
 
+        # Close unix socket listener and remove the socket file it bound
+        if self._unix_socket:
+            try:
+                self._wake_listener(self._unix_socket)
+                self._unix_socket.close()
+                if self._unix_socket_bound and self._owns_unix_socket_file():
+                    os.unlink(self.config.unix_socket_path)
+            except socket.error as e:
+                self._logger.error(f"Error closing unix socket: {e}")
+            finally:
+                self._unix_socket = None
+                self._unix_socket_bound = False
+                self._unix_socket_inode = None
+
+    @staticmethod
+    def _wake_listener(listener: socket.socket) -> None:
+        """
+        Shut down a listening socket so a thread blocked in accept() returns.
+
+        Closing alone does not interrupt a pending accept() on Linux, which
+        keeps the listener open until the next connection arrives.
+
+        Args:
+            listener: Listening socket to shut down
+        """
+        try:
+            listener.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            # Not listening or already shut down
+            pass
+
+    def _owns_unix_socket_file(self) -> bool:
+        """Check that unix_socket_path is still the socket file this server bound."""
+        try:
+            st = os.lstat(self.config.unix_socket_path)
+        except FileNotFoundError:
+            return False
+        return stat.S_ISSOCK(st.st_mode) and st.st_ino == self._unix_socket_inode
+
+
+def _parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """
+    Parse command line options for the server script.
+
+    Args:
+        argv: Argument list, or None to use sys.argv
+
+    Returns:
+        Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument("--port", type=int, default=1212, help="Forwarding port")
+    parser.add_argument(
+        "--tcp-nodelay", action="store_true", help="Disable Nagle's algorithm"
+    )
+    parser.add_argument(
+        "--send-buffer-size", type=int, help="SO_SNDBUF for client sockets"
+    )
+    parser.add_argument(
+        "--recv-buffer-size", type=int, help="SO_RCVBUF for the Gazepoint socket"
+    )
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        help="Coalesce records and flush every N seconds",
+    )
+    parser.add_argument(
+        "--unix-socket", dest="unix_socket_path", help="Also listen on this unix socket"
+    )
+    return parser.parse_args(argv)
 
-def main():
+
+def main(argv: Optional[List[str]] = None):
     """Main entry point for running the Gazepoint server."""
+    args = _parse_args(argv)
+
     # Configure logging for the main function
     logging.basicConfig(
         level=logging.INFO,
@@ -263,8 +507,19 @@ def main():
     logger = logging.getLogger(__name__)
 
     # Create server and client configurations
-    server_config = ServerConfig(port=1212)
-    gazepoint_config = GazepointConfig(host="127.0.0.1", port=4242)
+    server_config = ServerConfig(
+        port=args.port,
+        tcp_nodelay=args.tcp_nodelay,
+        send_buffer_size=args.send_buffer_size,
+        flush_interval=args.flush_interval,
+        unix_socket_path=args.unix_socket_path,
+    )
+    gazepoint_config = GazepointConfig(
+        host="127.0.0.1",
+        port=4242,
+        tcp_nodelay=args.tcp_nodelay,
+        recv_buffer_size=args.recv_buffer_size,
+    )
 
     # Initialize server and client
     server = DataForwardingServer(server_config)
@@ -7,20 +7,34 @@ import socket
 import threading
 import time
 from dataclasses import dataclass
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Union
 import logging
 from contextlib import contextmanager
 
+from gazepointinterface.socket_utils import create_socket, validate_buffer_size
+
 
 @dataclass
 class GazeServerConfig:
-    """Configuration for gaze server connection."""
+    """
+    Configuration for gaze server connection.
+
+    When unix_socket_path is set the client connects to that path and
+    host/port are ignored.
+    """
 
     host: str
     port: int
     message_length: int
     buffer_size: int = 1024
     xml_start_tag: str = "<REC"
+    # Transport tuning; each option can be toggled independently.
+    tcp_nodelay: bool = False
+    recv_buffer_size: Optional[int] = None
+    unix_socket_path: Optional[str] = None
+
+    def __post_init__(self):
+        validate_buffer_size("recv_buffer_size", self.recv_buffer_size)
 
 
 class SimGazeClient:
@@ -69,14 +83,38 @@ class SimGazeClient:
         Raises:
             ConnectionError: If connection cannot be established
         """
+        sock = None
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.connect((self._config.host, self._config.port))
+            sock = self._create_socket()
+            sock.connect(self._address())
             yield sock
         except socket.error as e:
             raise ConnectionError(f"Failed to connect to server: {e}")
         finally:
-            sock.close()
+            if sock:
+                sock.close()
+
+    def _create_socket(self) -> socket.socket:
+        """
+        Create a socket for the configured transport and apply tuning options.
+
+        Returns:
+            Unconnected socket object
+
+        Raises:
+            socket.error: If the socket cannot be created or configured
+        """
+        return create_socket(
+            unix=bool(self._config.unix_socket_path),
+            tcp_nodelay=self._config.tcp_nodelay,
+            recv_buffer_size=self._config.recv_buffer_size,
+        )
+
+    def _address(self) -> Union[str, Tuple[str, int]]:
+        """Return the address to connect to for the configured transport."""
+        if self._config.unix_socket_path:
+            return self._config.unix_socket_path
+        return (self._config.host, self._config.port)
 
     def connect(self) -> None:
         """
@@ -86,8 +124,8 @@ class SimGazeClient:
             ConnectionError: If connection cannot be established
         """
         try:
-            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self._socket.connect((self._config.host, self._config.port))
+            self._socket = self._create_socket()
+            self._socket.connect(self._address())
             self._running = True
 
             self._receive_thread = threading.Thread(
@@ -95,12 +133,13 @@ class SimGazeClient:
             )
             self._receive_thread.start()
 
-            self._logger.info(
-                f"Connected to gaze server at {self._config.host}:{self._config.port}"
-            )
+            self._logger.info(f"Connected to gaze server at {self._address()}")
 
         except socket.error as e:
             self._logger.error(f"Failed to connect: {e}")
+            if self._socket:
+                self._socket.close()
+                self._socket = None
             raise ConnectionError(f"Could not connect to server: {e}")
 
     def _process_message(self, message: str) -> None:
@@ -0,0 +1,121 @@
+"""
+Socket helpers shared by the forwarding server and the simulation client.
+"""
+
+import socket
+from typing import List, Optional
+
+# Upper bound on buffers passed to a single sendmsg() call (POSIX IOV_MAX).
+_MAX_IOV = 1024
+
+# setsockopt() takes a C int for SO_SNDBUF/SO_RCVBUF.
+_MAX_BUFFER_SIZE = 2**31 - 1
+
+
+def validate_buffer_size(name: str, value: Optional[int]) -> None:
+    """
+    Validate a socket buffer size option.
+
+    Args:
+        name: Option name used in the error message
+        value: Buffer size in bytes, or None for the OS default
+
+    Raises:
+        ValueError: If value is not None or a positive int that fits a C int
+    """
+    if value is None:
+        return
+    if (
+        not isinstance(value, int)
+        or isinstance(value, bool)
+        or not 0 < value <= _MAX_BUFFER_SIZE
+    ):
+        raise ValueError(
+            f"{name} must be a positive integer up to {_MAX_BUFFER_SIZE} "
+            f"or None. Got {value!r}"
+        )
+
+
+def configure_socket(
+    sock: socket.socket,
+    tcp_nodelay: bool = False,
+    send_buffer_size: Optional[int] = None,
+    recv_buffer_size: Optional[int] = None,
+) -> None:
+    """
+    Apply latency-related options to a socket.
+
+    Args:
+        sock: Socket to configure
+        tcp_nodelay: Disable Nagle's algorithm (ignored for non-TCP sockets)
+        send_buffer_size: Value for SO_SNDBUF, or None to keep the OS default
+        recv_buffer_size: Value for SO_RCVBUF, or None to keep the OS default
+    """
+    if tcp_nodelay and sock.family in (socket.AF_INET, socket.AF_INET6):
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    if send_buffer_size is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, send_buffer_size)
+    if recv_buffer_size is not None:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, recv_buffer_size)
+
+
+def create_socket(
+    unix: bool = False,
+    tcp_nodelay: bool = False,
+    send_buffer_size: Optional[int] = None,
+    recv_buffer_size: Optional[int] = None,
+) -> socket.socket:
+    """
+    Create a stream socket and apply tuning options to it.
+
+    Args:
+        unix: Create an AF_UNIX socket instead of an AF_INET one
+        tcp_nodelay: Disable Nagle's algorithm (ignored for unix sockets)
+        send_buffer_size: Value for SO_SNDBUF, or None to keep the OS default
+        recv_buffer_size: Value for SO_RCVBUF, or None to keep the OS default
+
+    Returns:
+        Unconnected socket object
+
+    Raises:
+        socket.error: If the socket cannot be created or configured
+    """
+    if unix:
+        if not hasattr(socket, "AF_UNIX"):
+            raise socket.error("Unix domain sockets are not supported on this platform")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+
+    try:
+        configure_socket(sock, tcp_nodelay, send_buffer_size, recv_buffer_size)
+    except socket.error:
+        sock.close()
+        raise
+    return sock
+
+
+def send_buffers(sock: socket.socket, buffers: List[bytes]) -> None:
+    """
+    Send a list of buffers with as few syscalls as possible.
+
+    Uses scatter-gather sendmsg() where available and falls back to a single
+    sendall() of the joined buffers otherwise (e.g. on Windows).
+
+    Args:
+        sock: Connected socket to write to
+        buffers: Byte buffers to send, in order
+    """
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(b"".join(buffers))
+        return
+
+    pending = [memoryview(buf) for buf in buffers if buf]
+    while pending:
+        sent = sock.sendmsg(pending[:_MAX_IOV])
+        # Drop fully written buffers and trim a partially written one
+        while pending and sent >= len(pending[0]):
+            sent -= len(pending[0])
+            pending.pop(0)
+        if sent:
+            pending[0] = pending[0][sent:]
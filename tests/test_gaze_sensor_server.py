@@ -0,0 +1,283 @@
+"""Tests for the data forwarding server transport options."""
+
+import os
+import socket
+import time
+
+import pytest
+
+from gazepointinterface import gaze_sensor_server
+from gazepointinterface.gaze_sensor_server import (
+    DataForwardingServer,
+    GazepointConfig,
+    ServerConfig,
+)
+from gazepointinterface.sim_client.gaze_data_client import (
+    GazeServerConfig,
+    SimGazeClient,
+)
+from gazepointinterface.socket_utils import send_buffers
+
+unix_only = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires unix domain sockets"
+)
+
+RECORD_A = b'<REC A="1.0" />\r\n'
+RECORD_B = b'<REC B="2.0" />\r\n'
+
+
+class PartialWriteSocket:
+    """Fake socket whose sendmsg() writes at most a few bytes per call."""
+
+    def __init__(self, chunk: int):
+        self.chunk = chunk
+        self.data = b""
+
+    def sendmsg(self, buffers):
+        out = b"".join(bytes(buf) for buf in buffers)[: self.chunk]
+        self.data += out
+        return len(out)
+
+
+class NoSendmsgSocket:
+    """Fake socket without sendmsg(), as on Windows."""
+
+    def __init__(self):
+        self.data = b""
+
+    def sendall(self, data):
+        self.data += data
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("Timed out waiting for condition")
+        time.sleep(0.01)
+
+
+def _tcp_client(port: int) -> socket.socket:
+    sock = socket.create_connection(("127.0.0.1", port), timeout=2.0)
+    return sock
+
+
+def _unix_client(path: str) -> socket.socket:
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(2.0)
+    sock.connect(path)
+    return sock
+
+
+def _read_until_closed(sock: socket.socket) -> bytes:
+    data = b""
+    while True:
+        chunk = sock.recv(4096)
+        if not chunk:
+            return data
+        data += chunk
+
+
+def _assert_not_listening(port: int) -> None:
+    with pytest.raises(ConnectionRefusedError):
+        socket.create_connection(("127.0.0.1", port), timeout=2.0).close()
+
+
+@pytest.fixture
+def tcp_config():
+    return ServerConfig(host="127.0.0.1", port=_free_port())
+
+
+def test_send_buffers_handles_partial_writes():
+    buffers = [RECORD_A, b"", RECORD_B, RECORD_A]
+    sock = PartialWriteSocket(chunk=3)
+    send_buffers(sock, buffers)
+    assert sock.data == b"".join(buffers)
+
+
+def test_send_buffers_falls_back_without_sendmsg():
+    buffers = [RECORD_A, RECORD_B]
+    sock = NoSendmsgSocket()
+    send_buffers(sock, buffers)
+    assert sock.data == b"".join(buffers)
+
+
+@pytest.mark.parametrize("interval", [0, -0.01])
+def test_flush_interval_must_be_positive(interval):
+    with pytest.raises(ValueError):
+        ServerConfig(flush_interval=interval)
+
+
+@pytest.mark.parametrize("size", [0, -1, 65536.0, 2**40, True])
+def test_buffer_sizes_are_validated(size):
+    with pytest.raises(ValueError):
+        ServerConfig(send_buffer_size=size)
+    with pytest.raises(ValueError):
+        GazepointConfig(recv_buffer_size=size)
+    with pytest.raises(ValueError):
+        GazeServerConfig(host="localhost", port=1, message_length=1, recv_buffer_size=size)
+
+
+def test_accepted_sockets_are_tuned(tcp_config, monkeypatch):
+    configured = []
+    configure_socket = gaze_sensor_server.configure_socket
+
+    def record(sock, **kwargs):
+        configure_socket(sock, **kwargs)
+        configured.append(sock)
+
+    monkeypatch.setattr(gaze_sensor_server, "configure_socket", record)
+    tcp_config.tcp_nodelay = True
+    tcp_config.send_buffer_size = 32768
+    server = DataForwardingServer(tcp_config)
+    server.start()
+    client = _tcp_client(tcp_config.port)
+    try:
+        _wait_for(lambda: server.client_count == 1)
+        accepted = configured[0]
+        assert accepted.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+        # Linux reports double the requested size to account for bookkeeping
+        assert accepted.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF) >= 32768
+
+        server.forward_data(RECORD_A.decode())
+        server.close()
+        assert _read_until_closed(client) == RECORD_A
+    finally:
+        client.close()
+        server.close()
+
+
+def test_close_flushes_pending_records(tcp_config):
+    # Long interval so the only flush is the final one on close()
+    tcp_config.flush_interval = 60.0
+    server = DataForwardingServer(tcp_config)
+    server.start()
+    client = _tcp_client(tcp_config.port)
+    try:
+        _wait_for(lambda: server.client_count == 1)
+        server.forward_data(RECORD_A.decode())
+        server.forward_data(RECORD_B.decode())
+        server.close()
+        assert _read_until_closed(client) == RECORD_A + RECORD_B
+    finally:
+        client.close()
+        server.close()
+
+
+def test_records_are_dropped_while_stopped(tcp_config):
+    tcp_config.flush_interval = 60.0
+    server = DataForwardingServer(tcp_config)
+    server.forward_data(RECORD_A.decode())
+    server.start()
+    server.close()
+    server.forward_data(RECORD_A.decode())
+
+    server.start()
+    client = _tcp_client(tcp_config.port)
+    try:
+        _wait_for(lambda: server.client_count == 1)
+        server.forward_data(RECORD_B.decode())
+        server.close()
+        assert _read_until_closed(client) == RECORD_B
+    finally:
+        client.close()
+        server.close()
+
+
+@unix_only
+@pytest.mark.parametrize("flush_interval", [None, 0.01])
+def test_forwards_over_unix_socket(tcp_config, tmp_path, flush_interval):
+    path = str(tmp_path / "gaze.sock")
+    tcp_config.unix_socket_path = path
+    tcp_config.flush_interval = flush_interval
+    server = DataForwardingServer(tcp_config)
+    server.start()
+    client = _unix_client(path)
+    try:
+        _wait_for(lambda: server.client_count == 1)
+        server.forward_data(RECORD_A.decode())
+        server.forward_data(RECORD_B.decode())
+        server.close()
+        assert _read_until_closed(client) == RECORD_A + RECORD_B
+    finally:
+        client.close()
+        server.close()
+    assert not os.path.exists(path)
+
+
+@unix_only
+def test_sim_client_connects_over_unix_socket(tcp_config, tmp_path):
+    path = str(tmp_path / "gaze.sock")
+    tcp_config.unix_socket_path = path
+    server = DataForwardingServer(tcp_config)
+    server.start()
+    record = RECORD_A.decode()
+    client = SimGazeClient(
+        GazeServerConfig(
+            host="localhost",
+            port=1,
+            message_length=len(record),
+            unix_socket_path=path,
+        )
+    )
+    try:
+        client.connect()
+        _wait_for(lambda: server.client_count == 1)
+        server.forward_data(record)
+        _wait_for(lambda: client.get_latest_message() == record)
+    finally:
+        client.disconnect()
+        server.close()
+
+
+@unix_only
+def test_stale_unix_socket_is_replaced_and_removed(tcp_config, tmp_path):
+    path = str(tmp_path / "gaze.sock")
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(path)
+    stale.close()
+
+    tcp_config.unix_socket_path = path
+    server = DataForwardingServer(tcp_config)
+    server.start()
+    try:
+        _unix_client(path).close()
+    finally:
+        server.close()
+    assert not os.path.exists(path)
+
+
+@unix_only
+def test_regular_file_at_unix_socket_path_is_kept(tcp_config, tmp_path):
+    path = tmp_path / "regular.txt"
+    path.write_text("keep me")
+
+    tcp_config.unix_socket_path = str(path)
+    server = DataForwardingServer(tcp_config)
+    with pytest.raises(OSError):
+        server.start()
+    assert path.read_text() == "keep me"
+    _assert_not_listening(tcp_config.port)
+
+
+@unix_only
+def test_live_unix_socket_is_not_taken_over(tcp_config, tmp_path):
+    path = str(tmp_path / "gaze.sock")
+    other = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    other.bind(path)
+    other.listen(1)
+    try:
+        tcp_config.unix_socket_path = path
+        server = DataForwardingServer(tcp_config)
+        with pytest.raises(OSError):
+            server.start()
+        _assert_not_listening(tcp_config.port)
+        _unix_client(path).close()
+    finally:
+        other.close()